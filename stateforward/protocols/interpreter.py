@@ -6,7 +6,7 @@ This module contains the implementation of the `Interpreter` protocol, which is
 
 ### Classes
 
-- `InterpreterStep`: An `Enum` representing the state of a step within the `Interpreter`. Possible values are `complete`, `incomplete`, and `deferred`.
+- `InterpreterStep`: An `Enum` representing the state of a step within the `Interpreter`. Possible values are `complete`, `incomplete`, and `deferred`, which are also bound to the module level constants `COMPLETE`, `INCOMPLETE` and `DEFERRED`.
 
 - `Interpreter`: A protocol that defines the interface for an interpreter instance. These instances are responsible for orchestrating elements of the state-forwarding model. They manage a queue, a clock, a stack of futures, and a logging instance.
 
@@ -16,7 +16,7 @@ This module contains the implementation of the `Interpreter` protocol, which is
 
 - `send`: Takes an event of type `model.Element` and schedules it for processing, returning a `Future` representing the eventual result of processing this event.
 
-- `start`: Initiates the interpreter loop which can be provided through the `loop` parameter; if `None`, the default event loop is used.
+- `start`: Initiates the interpreter loop which can be provided through the `loop` parameter; if `None`, the running event loop is used.
 
 - `wait`: Waits on a collection of `tasks`, which can be either `asyncio.Task` or `asyncio.Future` objects. It accepts an optional `name` to identify the wait operation and a `return_when` strategy that governs when the wait should return.
 
@@ -69,6 +69,13 @@ class InterpreterStep(Enum):
     deferred = "deferred"
 
 
+# module level aliases of the steps for hot comparisons, accessing an enum member
+# through its class goes through a descriptor while a global is a single lookup
+COMPLETE: typing.Final[InterpreterStep] = InterpreterStep.complete
+INCOMPLETE: typing.Final[InterpreterStep] = InterpreterStep.incomplete
+DEFERRED: typing.Final[InterpreterStep] = InterpreterStep.deferred
+
+
 class Interpreter(typing.Protocol[T]):
     """
     A protocol class that defines the interface for an interpreter capable of handling events,
@@ -154,7 +161,7 @@ class Interpreter(typing.Protocol[T]):
         
         Args:
             loop (asyncio.AbstractEventLoop, optional):
-                 The event loop to run the instance on. If None is provided, the default event loop is used.
+                 The event loop to run the instance on. If None is provided, the running event loop is used.
 
         """
         ...
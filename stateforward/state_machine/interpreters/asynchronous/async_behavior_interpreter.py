@@ -17,14 +17,21 @@ The module leverages `asyncio` for handling concurrency and asynchronous operati
 from stateforward import core, model
 import typing
 import asyncio
+import collections
+import logging
 
 from stateforward.state_machine.log import create_logger
 from stateforward.protocols.logger import Logger
-from stateforward.protocols.interpreter import InterpreterStep
+from stateforward.protocols.interpreter import (
+    InterpreterStep,
+    COMPLETE,
+    DEFERRED,
+)
 from stateforward.state_machine.clocks import Clock
 from stateforward.protocols import Queue
 from stateforward.state_machine.interpreters.asynchronous.async_interpreter import (
     AsyncInterpreter,
+    qualified_name_of,
 )
 
 
@@ -48,7 +55,7 @@ class AsyncBehaviorInterpreter(AsyncInterpreter, clock=Clock):
     
     Args:
         queue (Queue, optional):
-             An asyncio Queue instance used to manage the event queue. Defaults to None, where an asyncio.Queue() will be created.
+             A queue instance used to manage the event queue. Defaults to None, where a collections.deque() will be created.
         log (Logger, optional):
              Logger instance for logging/debugging. Defaults to None, where a new logger is created based on the model's qualified name.
         step(self):
@@ -87,11 +94,11 @@ class AsyncBehaviorInterpreter(AsyncInterpreter, clock=Clock):
         """
         __init__(self, queue: Queue=None, log: Logger=None)
         Initializes a new instance of the enclosing class with optional queue and log parameters.
-        This method sets up the class instance with a specified or default asynchronous queue and logging system. If no queue is provided, an asyncio Queue instance is created. If no logger is provided, a new logger is created based on the qualified name of the class instance via the create_logger function. The method also initializes a list to keep track of deferred tasks.
+        This method sets up the class instance with a specified or default queue and logging system. If no queue is provided, a collections.deque instance is created since events are produced and consumed within the same event loop. If no logger is provided, a new logger is created based on the qualified name of the class instance via the create_logger function. The method also initializes a list to keep track of deferred tasks.
         
         Args:
             queue (Queue, optional):
-                 An instance of a queue for task management. Defaults to None, in which case a new asyncio Queue is created.
+                 An instance of a queue for task management. Defaults to None, in which case a new collections.deque is created.
             log (Logger, optional):
                  A logging instance to log messages and errors. Defaults to None, in which case a new logger is created based on the qualified name of the class instance.
         
@@ -101,7 +108,7 @@ class AsyncBehaviorInterpreter(AsyncInterpreter, clock=Clock):
 
         """
         super().__init__(
-            queue=queue or asyncio.Queue(),
+            queue=queue if queue is not None else collections.deque(),
             log=log or create_logger(model.qualified_name_of(self)),
         )
         self.deferred = []
@@ -112,6 +119,9 @@ class AsyncBehaviorInterpreter(AsyncInterpreter, clock=Clock):
         This async method processes events that are pending in the machine's queue, handling each event according to the state machine's logic. During the step, it ensures that each event is either processed completely or deferred for later processing. The state machine evaluates events from its internal queue, deferred events from the previous step, and new events that arrive during the cycle. Duplicate events are filtered out, ensuring that each unique event is processed only once per iteration. Processed events are logged for debugging purposes, and any events that are determined to be owned by no one are stacked for result assignment. If an event signals the completion of the processing cycle, the method will clear the list of processed events and break out of the loop for the current step.
         The method uses an internal while loop that runs as long as there are events to process. Events that have already been processed are skipped in subsequent iterations. Once all events are processed, the loop will end, updating the deferred list with any events that were not processed and need to be revisited in the next step. The method concludes by setting the result for any futures in the stack that have been processed, thus completing the step.
         
+        A failed future in the stack, e.g. a state activity that raised, does not stop the step. Its exception is
+        raised by `pop` when its element leaves the stack, i.e. when the state is exited or the interpreter terminates.
+
         Note that this method should be used within the context of an async function or coroutine due to its asynchronous nature.
         
         Returns:
@@ -120,46 +130,56 @@ class AsyncBehaviorInterpreter(AsyncInterpreter, clock=Clock):
                 internal state based on event processing.
 
         """
-        processed = []
-        events = []
+        # events processed since the last completed event, a set so the check below is a subset test
+        processed = set()
+        # events left over when an iteration stops early, popped from the left
+        events = collections.deque()
         deferred = self.deferred
         stack = []
-        while events := list(
-            dict.fromkeys(
-                (
-                    # include active events in the event pool
-                    *(event for event in self.model.pool if event in self.stack),
-                    # include deferred events from the previous iteration
-                    *deferred,
-                    # include events from the previous iteration
-                    *events,
-                    # include events from the queue
-                    *(self.queue.get_nowait() for _ in range(self.queue.qsize())),
-                )
-            )
-        ):
+        # the event pool is an insertion ordered dict so duplicate events are dropped,
+        # it is cleared and refilled in place on every iteration
+        pool = {}
+        while True:
+            pool.clear()
+            # include active events in the event pool
+            active = self.stack
+            for event in self.model.pool:
+                if event in active:
+                    pool[event] = None
+            # include deferred events from the previous iteration
+            for event in deferred:
+                pool[event] = None
+            # include events from the previous iteration
+            for event in events:
+                pool[event] = None
+            # include events from the queue
+            for event in self.drain():
+                pool[event] = None
+            if not pool:
+                break
+            events = collections.deque(pool)
             # reset deferred events
             deferred = []
             # if all events have been processed this iteration is complete
-            if not all(event in processed for event in events):
-                # clear the idle flag to prevent interruptions
+            if not processed.issuperset(pool):
                 while events:
-                    # pop the first event from the list
-                    event = events.pop(0)
+                    # pop the first event from the queue
+                    event = events.popleft()
                     results = await self.exec_event_processing(event)
-                    self.log.debug(
-                        f"Processed {model.qualified_name_of(event)} results {results} and {processed}"
-                    )
+                    if self.log.isEnabledFor(logging.DEBUG):
+                        self.log.debug(
+                            f"Processed {qualified_name_of(event)} results {results} and {processed}"
+                        )
                     # add the event to the list of processed events
-                    if results is InterpreterStep.deferred:
+                    if results is DEFERRED:
                         deferred.append(event)
                     else:
                         if model.owner_of(event) is None:
                             stack.append((self.pop(event), results))
-                        if results is InterpreterStep.complete:
-                            processed = []
+                        if results is COMPLETE:
+                            processed.clear()
                             break
-                    processed.append(event)
+                    processed.add(event)
                 continue
             break
         self.deferred = deferred
@@ -184,10 +204,13 @@ class AsyncBehaviorInterpreter(AsyncInterpreter, clock=Clock):
         Returns:
 
         """
-        behavior_name = model.qualified_name_of(behavior)
-        self.log.debug(f"Executing {behavior_name}")
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(f"Executing {qualified_name_of(behavior)}")
         value = behavior.activity(event)
-        if asyncio.isfuture(value) or asyncio.iscoroutine(value):
+        # synchronous activities mostly return None, which skips both awaitable checks
+        if value is not None and (
+            asyncio.isfuture(value) or asyncio.iscoroutine(value)
+        ):
             value = await value
         return value
 
@@ -1,67 +1,212 @@
 """
 
-The `async_interpreter` module provides an asynchronous execution framework specifically designed for state-based systems, utilizing asynchronous I/O provided by Python's asyncio library. It is built upon the concept of interacting with different models, events, queues, and clocks within state-based systems. This module contains several key classes and components, each working together to execute sequences of operations in a non-blocking manner. Key components include `InterpreterStep`, `AsyncInterpreter`, and `Null`, as well as crucial controllable constructs such as `queue`, `clock`, `stack`, and `log`. The module defines the functioning of an asynchronous interpreter for state machine workflows, providing methods for event handling, concurrency management, and execution control. Notably, the `AsyncInterpreter` class inherits from `model.Element` and is parameterized to work with various model types, enriching its capability to interface with different state machine elements. This module is essential for scenarios where asynchronous event handling and state management are paramount, and it relies heavily on the asyncio event loop and future constructs for its operation.
+The `async_interpreter` module provides an asynchronous execution framework specifically designed for state-based systems, utilizing asynchronous I/O provided by Python's asyncio library. It is built upon the concept of interacting with different models, events, queues, and clocks within state-based systems. This module contains several key classes and components, each working together to execute sequences of operations in a non-blocking manner. Key components include `InterpreterStep`, `AsyncInterpreter`, `Null` and `Waiter`, as well as crucial controllable constructs such as `queue`, `clock`, `stack`, and `log`. The module defines the functioning of an asynchronous interpreter for state machine workflows, providing methods for event handling, concurrency management, and execution control. Notably, the `AsyncInterpreter` class inherits from `model.Element` and is parameterized to work with various model types, enriching its capability to interface with different state machine elements. This module is essential for scenarios where asynchronous event handling and state management are paramount, and it relies heavily on the asyncio event loop and future constructs for its operation.
 """
 import typing
+import collections
 from stateforward import model
-from enum import Enum
 import asyncio
 from stateforward.protocols.future import Future
 from stateforward.protocols.clock import Clock
 from stateforward.protocols.queue import Queue
+# InterpreterStep used to be defined in this module, it is re-exported so existing imports keep working
+from stateforward.protocols.interpreter import InterpreterStep  # noqa: F401
 import logging
 
+try:
+    import uvloop
+except ImportError:
+    try:
+        # winloop is the uvloop port for windows and exposes the same api
+        import winloop as uvloop
+    except ImportError:
+        uvloop = None
+
 
 T = typing.TypeVar("T", bound=model.Model)
 
 
-class Null(asyncio.Future):
+class Null:
     """
-    A placeholder class designed to represent a Future with no value.
-    This class is a subclass of `asyncio.Future` and is intended for scenarios where a Future-like object is required, but no actual result is expected. Upon initialization, it immediately sets its own result to `None`.
-    
-    Attributes:
-        None:
-             This class does not have any public attributes besides those provided by its superclass.
-    
+    A placeholder that represents a Future which is already done with no value.
+    This class implements only the part of the `asyncio.Future` interface the interpreter relies on. Unlike a real
+    `asyncio.Future` it is not bound to an event loop, so the module level `NULL` instance can be created at import
+    time and shared across loops. It is always done, never cancelled, its result is `None` and callbacks are invoked
+    immediately.
+
     Methods:
-        __init__:
-             Constructs a new `Null` object and sets its result to `None`.
-            The `Null` class does not have its own methods, but inherits all methods from `asyncio.Future`.
+        done():
+             Always returns True.
+        cancelled():
+             Always returns False.
+        result():
+             Always returns None.
+        exception():
+             Always returns None.
+        add_done_callback(callback):
+             Invokes the callback immediately with the placeholder.
+        remove_done_callback(callback):
+             Returns 0 since no callback is ever registered.
+        set_result(result):
+             Ignores the result since the placeholder is already done.
 
     """
 
-    def __init__(self):
-        """
-        Initializes a new instance of the class.
-        This constructor method sets up the initial state of the object by calling its superclass initializer and setting the result attribute to None.
+    __slots__ = ()
 
-        """
-        super().__init__()
-        self.set_result(None)
+    def done(self) -> bool:
+        return True
+
+    def cancelled(self) -> bool:
+        return False
+
+    def result(self) -> None:
+        return None
+
+    def exception(self) -> None:
+        return None
+
+    def add_done_callback(
+        self, callback: typing.Callable[["Null"], typing.Any], *, context=None
+    ) -> None:
+        callback(self)
+
+    def remove_done_callback(
+        self, callback: typing.Callable[["Null"], typing.Any]
+    ) -> int:
+        return 0
+
+    def set_result(self, result: typing.Any) -> None:
+        pass
+
+    def __await__(self):
+        return iter(())
 
 
 NULL = Null()
 
 
-class InterpreterStep(Enum):
+class Waiter:
     """
-    An enumeration to represent the status of an interpretation step.
-    This class is an enumeration (Enum) which categorizes the state of an interpretation step into one of three possible statuses:
-    
+    Done callback used by `AsyncInterpreter.wait` to resolve a future once a group of futures meets a wait condition.
+    A single instance is installed as the done callback of every awaited future, so waiting does not allocate a
+    closure per call and the same object can be removed from the futures again once the wait is over.
+
     Attributes:
-        complete (str):
-             A status indicating that the interpretation step is complete and no further action is required.
-        incomplete (str):
-             A status indicating that the interpretation step is not fully resolved and may require additional information or action.
-        deferred (str):
-             A status that denotes a delay in the completion or evaluation of the interpretation step, potentially awaiting external input or another event.
+        future (asyncio.Future):
+             The future resolved once the wait condition is met.
+        tasks (tuple[Union[asyncio.Task, asyncio.Future], ...]):
+             The futures being awaited.
+        pending (int):
+             The number of awaited futures that are not done yet.
+        failure (Optional[BaseException]):
+             The first exception raised by an awaited future.
+        wait_all (bool):
+             Whether the wait condition is asyncio.ALL_COMPLETED.
+        wait_first (bool):
+             Whether the wait condition is asyncio.FIRST_COMPLETED.
+
+    """
+
+    __slots__ = ("future", "tasks", "pending", "failure", "wait_all", "wait_first")
+
+    def __init__(
+        self,
+        future: asyncio.Future,
+        tasks: tuple[typing.Union[asyncio.Task, asyncio.Future], ...],
+        return_when: str,
+    ):
+        self.future = future
+        self.tasks = tasks
+        self.pending = len(tasks)
+        self.failure = None
+        # resolve the wait condition once rather than in every callback
+        self.wait_all = return_when == asyncio.ALL_COMPLETED
+        self.wait_first = return_when == asyncio.FIRST_COMPLETED
+
+    def __call__(self, task: asyncio.Future) -> None:
+        """
+        Records that an awaited future finished, resolving the future once the wait condition is met.
+        The future is cancelled if the finished future was cancelled and fails with the first exception
+        raised by an awaited future unless the condition is asyncio.ALL_COMPLETED and futures are pending.
+
+        Args:
+            task (asyncio.Future):
+                 The awaited future that finished.
+
+        """
+        self.pending -= 1
+        future = self.future
+        if future.done():
+            return
+        if task.cancelled():
+            future.cancel()
+            return
+        failure = self.failure = self.failure or task.exception()
+        if failure is not None and (not self.wait_all or not self.pending):
+            future.set_exception(failure)
+        elif self.wait_first or not self.pending:
+            future.set_result(None)
+
+    def release(self, future: asyncio.Future) -> None:
+        """
+        Removes this callback from the awaited futures once the future is resolved or cancelled.
+
+        Args:
+            future (asyncio.Future):
+                 The resolved future.
+
+        """
+        for task in self.tasks:
+            task.remove_done_callback(self)
+
+
+def qualified_name_of(element: model.Element) -> str:
+    """
+    Returns the qualified name of an element, caching it on element instances.
+    The owner of an element instance never changes once the model is created, so the name is
+    computed once with `model.qualified_name_of` and stored on the instance. Element classes are
+    not cached because their owner is assigned while the model is still being defined.
+
+    Args:
+        element (model.Element):
+             The element whose qualified name is requested.
+
+    Returns:
+        str:
+             The fully qualified name of the element.
+
+    """
+    namespace = getattr(element, "__dict__", None)
+    if namespace is None or isinstance(element, type):
+        return model.qualified_name_of(element)
+    qualified_name = namespace.get("__qualified_name__")
+    if qualified_name is None:
+        qualified_name = namespace["__qualified_name__"] = model.qualified_name_of(
+            element
+        )
+    return qualified_name
+
 
+async def gather(*aws: typing.Awaitable) -> list:
     """
+    Runs awaitables concurrently like `asyncio.gather`, awaiting a single awaitable directly.
+    Most regions hold a single state and most states a single region or outgoing transition, so
+    `asyncio.gather` would mostly wrap a single coroutine in a Task and a gathering future. In that
+    case the coroutine is awaited in the current task instead.
 
-    complete = "complete"
-    incomplete = "incomplete"
-    deferred = "deferred"
+    Args:
+        *aws (Awaitable):
+             The awaitables to run.
+
+    Returns:
+        list:
+             The results of the awaitables in the order they were given.
+
+    """
+    if len(aws) > 1:
+        return await asyncio.gather(*aws)
+    return [await aw for aw in aws]
 
 
 class AsyncInterpreter(model.Element, typing.Generic[T]):
@@ -72,21 +217,29 @@ class AsyncInterpreter(model.Element, typing.Generic[T]):
     maintain the state of in-flight operations.
     
     Attributes:
-        queue (Queue):
-             The queue for managing incoming events.
+        queue (Union[Queue, collections.deque]):
+             The queue for managing incoming events. A `collections.deque` is used directly
+            since the queue is only ever produced and consumed from within the event loop.
         clock (Clock):
              An object managing the clock speed for the interpreter's operations.
         stack (dict[model.Element, asyncio.Future]):
              A dictionary mapping state machine elements
-            to their associated futures/tasks.
+            to their associated futures/tasks. Elements are kept in the order they were pushed,
+            so iterating the stack visits outer states before the states nested in them.
         loop (asyncio.AbstractEventLoop):
              The event loop in which this interpreter operates.
         log (logging.Logger):
              Logger for the interpreter to output its activity.
         running (asyncio.Event):
              An event signaling whether the interpreter is currently running.
-        stepping (asyncio.Lock):
-             A lock to ensure step execution is done atomically.
+        wake (asyncio.Event):
+             An event set whenever there may be work for the next `step`, awaited by `run` between steps.
+        started (asyncio.Future):
+             A future resolved by `run` once the interpreter is running, awaited by `start`.
+        enqueue (Callable[[model.Element], None]):
+             The bound method used to put an event on the queue, resolved once when the interpreter is created.
+        create_task (Callable[..., asyncio.Task]):
+             The bound `create_task` method of the event loop, resolved once when the interpreter is started.
         model (T):
              A generic type parameter representing the state machine model.
     
@@ -102,13 +255,13 @@ class AsyncInterpreter(model.Element, typing.Generic[T]):
             Starts the interpreter within the given or default event loop.
         wait(self, *tasks:
              typing.Union[asyncio.Task, asyncio.Future],
-        name:
-             str=None, return_when: str=asyncio.FIRST_COMPLETED) -> asyncio.Task:
-            Waits for the given tasks to complete, returning an asyncio.Task wrapping the wait operation.
+        return_when:
+             str=asyncio.FIRST_COMPLETED) -> asyncio.Future:
+            Waits for the given tasks to complete, returning a future resolved by their done callbacks.
         run(self) -> None:
             The coroutine that runs the main event processing loop of the interpreter.
         step(self) -> None:
-            Processes the next set of tasks from the stack.
+            Raises the exception of any future in the stack that failed.
         is_active(self, *elements:
              model.Element) -> bool:
             Checks if the given elements are active within the current stack.
@@ -122,18 +275,52 @@ class AsyncInterpreter(model.Element, typing.Generic[T]):
             Pops an element and its associated task from the stack, handling its result.
         terminate(self) -> asyncio.Task:
             Terminates the interpreter, cleaning up and cancelling tasks as necessary.
+        configure(cls, use_uvloop:
+             bool=True) -> bool:
+            Installs the uvloop event loop policy when uvloop is available.
 
     """
 
-    queue: Queue = None
+    queue: typing.Union[Queue, collections.deque] = None
     clock: Clock
     stack: dict[model.Element, asyncio.Future] = None
     loop: asyncio.AbstractEventLoop = None
     log: logging.Logger = logging.getLogger(__name__)
     running: asyncio.Event = None
-    stepping: asyncio.Lock = None
+    wake: asyncio.Event = None
+    started: asyncio.Future = None
+    enqueue: typing.Callable[[model.Element], None] = None
+    create_task: typing.Callable[..., asyncio.Task] = None
 
-    def __init__(self, queue: Queue, log: logging.Logger = None):
+    @classmethod
+    def configure(cls, use_uvloop: bool = True) -> bool:
+        """
+        Configures the asyncio event loop policy used to run interpreters.
+        When `use_uvloop` is True and uvloop is installed, the uvloop event loop policy is installed so that loops
+        created afterwards (e.g. by `asyncio.run`) use uvloop's C implementation of the scheduler, futures and tasks.
+        On Windows winloop is used in place of uvloop. This must be called before the event loop is created and is a
+        no-op when neither is installed. The policy is never installed implicitly since it affects every event loop
+        created by the application.
+
+        Args:
+            use_uvloop (bool, optional):
+                 Whether to install the uvloop event loop policy. Defaults to True.
+
+        Returns:
+            bool:
+                 True if the uvloop event loop policy was installed, False otherwise.
+
+        """
+        if not use_uvloop or uvloop is None:
+            return False
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        return True
+
+    def __init__(
+        self,
+        queue: typing.Union[Queue, collections.deque],
+        log: logging.Logger = None,
+    ):
         """
         Initializes the instance with a queue, an optional log, and internal attributes.
         This method sets up the data structures and synchronization primitives required for the operation
@@ -141,7 +328,7 @@ class AsyncInterpreter(model.Element, typing.Generic[T]):
         prepares an asyncio event to manage the running state, and sets up logging.
         
         Args:
-            queue (Queue):
+            queue (Union[Queue, collections.deque]):
                  A queue object used for inter-thread or inter-process communication.
             log (logging.Logger, optional):
                  A logger instance for logging messages. If not provided, it falls back to a default logger.
@@ -153,19 +340,28 @@ class AsyncInterpreter(model.Element, typing.Generic[T]):
                  The queue object passed during initialization.
             running (asyncio.Event):
                  An event to indicate whether the instance is running.
+            wake (asyncio.Event):
+                 An event to indicate there may be work for the next step.
             log (logging.Logger):
                  A logger instance for outputting logs.
 
         """
+        # a dict keeps the elements in push order in a dense entry table next to its hash index,
+        # giving ordered iteration and O(1) membership and removal without a parallel index
         self.stack = {}
         self.queue = queue
+        # resolve the put method once instead of on every send
+        self.enqueue = (
+            queue.append if isinstance(queue, collections.deque) else queue.put_nowait
+        )
         self.running = asyncio.Event()
+        self.wake = asyncio.Event()
         self.log = log or self.log
 
     def send(self, event: model.Element):
         """
         Sends an event to be processed by the state machine.
-        This method logs the receipt of the event, pushes it to the stack along with a new Future object, adds the event to a queue, and then awaits the processing of the event. The method returns the result of waiting for the future associated with the event to be completed.
+        This method logs the receipt of the event, pushes it to the stack along with a new future created by the event loop, adds the event to a queue, and then awaits the processing of the event. The method returns the result of waiting for the future associated with the event to be completed.
         
         Args:
             event (model.Element):
@@ -173,17 +369,26 @@ class AsyncInterpreter(model.Element, typing.Generic[T]):
         
         Returns:
 
+        Raises:
+            RuntimeError:
+                 If the interpreter was started and has since terminated, so the event would never be processed.
+
         """
-        self.log.debug(f"Received {model.qualified_name_of(event)}")
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(f"Received {qualified_name_of(event)}")
+        task = self.stack.get(self)
+        if task is None and self.started is not None:
+            raise RuntimeError(f"{qualified_name_of(self)} is terminated")
         # push the event onto the stack
-        future = self.push(event, asyncio.Future())
+        # the loop is only bound once the interpreter is started
+        loop = self.loop or asyncio.get_running_loop()
+        future = self.push(event, loop.create_future())
         # add the event to the queue
-        self.queue.put_nowait(event)
-        return self.wait(
-            future,
-            self.stack.get(self),
-            name=f"{model.qualified_name_of(event)}.sent",
-        )
+        self.enqueue(event)
+        if task is None:
+            # not started yet, the event is processed once the interpreter runs
+            return future
+        return self.wait(future, task)
 
     def start(
         self,
@@ -199,127 +404,138 @@ class AsyncInterpreter(model.Element, typing.Generic[T]):
         Args:
             loop (asyncio.AbstractEventLoop, optional):
                  The event loop in which the state machine will
-                be run. If not provided, the current event loop will be used.
+                be run. If not provided, the running event loop will be used.
+
+        Raises:
+            RuntimeError:
+                 If no loop is provided and there is no running event loop.
         
         Returns:
             A `wait` wrapper that is used to wait for two events:
                  the task that runs the state machine
-                to complete, and a separate task that signals the state machine is running.
+                to complete, and the `started` future that signals the state machine is running.
 
         """
-        qualified_name = model.qualified_name_of(self)
-        self.log.debug(f"Starting {qualified_name}")
-        loop = self.loop = loop or asyncio.get_event_loop()
+        qualified_name = qualified_name_of(self)
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(f"Starting {qualified_name}")
+        loop = self.loop = loop or asyncio.get_running_loop()
+        self.create_task = loop.create_task
+        # resolved by run() so no extra task is needed to wait on the running event
+        started = self.started = loop.create_future()
         task = loop.create_task(self.run(), name=qualified_name)
         self.push(self, task)
-        return self.wait(task, self.loop.create_task(self.running.wait()))
+        return self.wait(task, started)
 
     def wait(
         self,
         *tasks: typing.Union[asyncio.Task, asyncio.Future],
-        name: str = None,
         return_when: str = asyncio.FIRST_COMPLETED,
-    ) -> asyncio.Task:
+    ) -> asyncio.Future:
         """
         Waits for the completion of one or more asyncio.Task or asyncio.Future objects.
-        This function is a coroutine that accepts any number of asyncio.Task or asyncio.Future
-        objects and an optional name for the underlying task that will wait for the
-        provided tasks or futures to complete. The function will schedule the execution
-        of these tasks or futures on the event loop, and wait until the conditions specified
-        by return_when are met. return_when can indicate waiting for the first task to
-        complete (asyncio.FIRST_COMPLETED), all tasks to complete (asyncio.ALL_COMPLETED),
-        or the first task to not be cancelled (asyncio.FIRST_EXCEPTION).
-        Upon completing the wait condition, the function will return the task that was created
-        to perform the wait operation. If any of the awaited tasks or futures raise an
-        exception during execution, the exception will be propagated.
-        
+        This function accepts any number of asyncio.Task or asyncio.Future objects and returns a future
+        that is resolved once the condition specified by return_when is met. return_when can indicate
+        waiting for the first task to complete (asyncio.FIRST_COMPLETED), all tasks to complete
+        (asyncio.ALL_COMPLETED), or the first task to raise an exception (asyncio.FIRST_EXCEPTION).
+        The returned future is resolved from done callbacks on the awaited tasks, so unlike `asyncio.wait`
+        no extra Task has to be scheduled on the event loop. If any of the awaited tasks or futures raise
+        an exception, the exception is propagated through the returned future, and if one is cancelled
+        the returned future is cancelled as well.
+
         Args:
             *tasks (Union[asyncio.Task, asyncio.Future]):
                  An arbitrary number of asyncio.Task
                 or asyncio.Future objects to be awaited.
-            name (str, optional):
-                 An optional name for the asyncio.Task that will be created
-                to perform the waiting operation. If not provided, a name is generated by
-                concatenating the names of the tasks with '_and_'.
             return_when (str):
                  The condition that determines when the wait operation
                 should return. Must be one of asyncio.FIRST_COMPLETED, asyncio.ALL_COMPLETED,
                 or asyncio.FIRST_EXCEPTION.
-        
+
         Returns:
-            asyncio.Task:
-                 The task that was created to wait for the provided tasks or futures.
+            asyncio.Future:
+                 The future that is resolved once the provided tasks or futures meet the wait condition.
 
         """
+        waiter = Waiter(self.loop.create_future(), tasks, return_when)
+        for task in tasks:
+            task.add_done_callback(waiter)
+        waiter.future.add_done_callback(waiter.release)
+        return waiter.future
 
-        async def wait_for_tasks(_tasks=tasks, _return_when=return_when):
-            """
-            Waits for the completion of tasks, possibly returning before all tasks are finished based on a condition.
-            This function asynchronously waits for the `_tasks` iterable of tasks to reach a completion state, which is determined by the `_return_when` condition. Once the condition is met, it retrieves one of the completed tasks from `done` set. If that task raised an exception, the exception is propagated by awaiting on the task object.
-            
-            Args:
-                _tasks (Iterable[Task]):
-                     The collection of asyncio.Task objects to wait on. Defaults to the `tasks` variable in the current context.
-                _return_when (str):
-                     The condition upon which the function should return. This condition dictates whether the function waits for all tasks to complete, or returns earlier. Defaults to the `return_when` variable in the current context.
-            
-            Returns:
-                Tuple[Set[Task], Set[Task]]:
-                     A tuple containing two sets. The first set contains all tasks that are done, and the second set contains all tasks that are pending.
-            
-            Raises:
-                Any exception raised by a task:
-                     If any task among `_tasks` raises an exception, that exception is propagated.
-
-            """
-            done, pending = await asyncio.wait(_tasks, return_when=_return_when)
-            task = done.pop()
-            if task.exception() is not None:
-                await task
-
-        return self.loop.create_task(
-            wait_for_tasks(),
-            name=name or "_and_".join(task.get_name() for task in tasks),
-        )
+    def drain(self) -> list[model.Element]:
+        """
+        Removes and returns every event currently in the queue without blocking.
+        A `collections.deque` is emptied in a single pass, while any other queue is drained
+        through `get_nowait` for the number of items reported by `qsize`.
+
+        Returns:
+            list[model.Element]:
+                 The events that were in the queue, in FIFO order.
+
+        """
+        queue = self.queue
+        if isinstance(queue, collections.deque):
+            events = list(queue)
+            queue.clear()
+            return events
+        return [queue.get_nowait() for _ in range(queue.qsize())]
 
     async def run(self) -> None:
         """
         Asynchronously runs the process associated with the class instance.
-        This coroutine continuously executes the 'step' method and awaits for a sleep interval based on the 'clock.multiplier'. It checks if the instance is active and if the 'running' flag is set before each iteration. If the 'running' flag is cancelled, it logs a debug message indicating the cancellation. If the 'running' flag is still set after an interruption, it ensures that the 'terminate' method is called.
+        This coroutine executes the 'step' method each time the 'wake' event is set, so an idle interpreter does not poll the event loop. It checks if the instance is active and if the 'running' flag is set before each iteration and after each wake, so clearing the flag and setting 'wake' stops the loop without cancelling it. If the task is cancelled, it logs a debug message indicating the cancellation. If the 'running' flag is still set after an interruption, it ensures that the 'terminate' method is called.
         
         Raises:
             asyncio.CancelledError:
                  If the coroutine is cancelled during its execution.
 
         """
-        self.log.debug(
-            f"Running {model.qualified_name_of(self)} clock multiplier {self.clock.multiplier}"
-        )
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(
+                f"Running {qualified_name_of(self)} clock multiplier {self.clock.multiplier}"
+            )
         if self.is_active(self):
             self.running.set()
+            if self.started is not None and not self.started.done():
+                self.started.set_result(None)
             try:
-                while self.running.is_set():
-                    await self.step()
-                    await asyncio.sleep(self.clock.multiplier)
+                # resolve the bound methods once instead of on every iteration
+                wait, clear, step = self.wake.wait, self.wake.clear, self.step
+                is_running = self.running.is_set
+                while is_running():
+                    await wait()
+                    clear()
+                    # terminate() wakes the loop so it can leave without being cancelled
+                    if not is_running():
+                        break
+                    await step()
             except asyncio.CancelledError:
-                self.log.debug(f"Cancelled {model.qualified_name_of(self)}")
+                if self.log.isEnabledFor(logging.DEBUG):
+                    self.log.debug(f"Cancelled {qualified_name_of(self)}")
             if self.running.is_set():
                 await self.terminate()
 
     async def step(self) -> None:
         """
-        Performs an asynchronous iteration step over a collection of futures stored in an instance's stack.
-        This method iterates through the values of the instance's stack attribute, which is expected to be a mapping of futures. It checks if any of the futures have raised an exception. If an exception is encountered in any future, it is immediately raised, halting the iteration.
-        
+        Performs an asynchronous step, raising the exception of any future in the stack that failed.
+        This method iterates through the futures in the stack and raises the exception of the first one that finished
+        with an exception. Interpreters that process events, such as `AsyncBehaviorInterpreter`, override it and leave
+        the exception to `pop`, so the scan does not run on every step of a state machine.
+
         Raises:
             Exception:
                  Any exception raised by a future in the stack.
-        
+
         Returns:
 
         """
         for future in self.stack.values():
-            if exception := future.exception() is not None:
+            if (
+                future.done()
+                and not future.cancelled()
+                and (exception := future.exception()) is not None
+            ):
                 raise exception
 
     def is_active(self, *elements: model.Element) -> bool:
@@ -336,11 +552,17 @@ class AsyncInterpreter(model.Element, typing.Generic[T]):
                  True if all specified elements are active (i.e., they exist in the stack); False otherwise.
 
         """
-        return bool(self.stack) and all(element in self.stack for element in elements)
+        stack = self.stack
+        if not stack:
+            return False
+        if len(elements) == 1:
+            # is_active(self) is the common case, skip building the generator
+            return elements[0] in stack
+        return all(element in stack for element in elements)
 
     def push(
         self, element: model.Element, future: typing.Union[Future, asyncio.Task] = NULL
-    ):
+    ) -> Future:
         """
         Pushes an element onto the stack with an associated future or task, ensuring uniqueness.
         This method adds an element to an internal stack, associating it with a future or an asyncio task, which may represent the element's processing state.
@@ -364,14 +586,19 @@ class AsyncInterpreter(model.Element, typing.Generic[T]):
                  If the element is already present in the stack.
 
         """
-        if element in self.stack:
+        stack = self.stack
+        size = len(stack)
+        # a single hash lookup, the size only stays the same if the element already exists
+        stack.setdefault(element, future)
+        if len(stack) == size:
             raise ValueError(
-                f"element {model.qualified_name_of(element)} already exists"
+                f"element {qualified_name_of(element)} already exists"
             )
-        future = self.stack.setdefault(element, future)
-        return typing.cast(Future, future)
+        # events are processed from the stack and the queue, so the next step has work to do
+        self.wake.set()
+        return future
 
-    def pop(self, element: model.Element, *, result: typing.Any = NULL):
+    def pop(self, element: model.Element, *, result: typing.Any = NULL) -> Future:
         """
         Pops an element from the stack and sets the result if specified.
         This method retrieves the future associated with a stack element, removes the element from the stack,
@@ -385,39 +612,43 @@ class AsyncInterpreter(model.Element, typing.Generic[T]):
                  The result to set on the future if not NULL. Defaults to NULL.
         
         Returns:
-            typing.cast(Future, future):
+            Future:
                  The future associated with the popped element.
         
         Raises:
 
         """
         future = self.stack.pop(element, NULL)
+        if future is NULL:
+            # vertices and regions are pushed without a future, skip the future checks
+            return future
         if future.done():
             if future.exception() is not None:
                 raise future.result()
             elif result is not NULL:
                 future.set_result(result)
-        return typing.cast(Future, future)
+        return future
 
     def terminate(self) -> asyncio.Task:
         """
-        Cancels the asynchronous task associated with the current instance if it is still running.
-        This method checks if the `running` attribute, presumably an instance of `threading.Event` or similar,
-        is set. If it is, it clears the `running` attribute to stop the task. It then retrieves the current
-        task using a `pop` method and inspects it. If the task is not yet completed, it will attempt
-        to cancel it by calling its `cancel` method. The task object, now potentially canceled, is
-        then recast as an `asyncio.Task` and returned.
-        
+        Stops the asynchronous task associated with the current instance if it is still running.
+        This method checks if the `running` event is set. If it is, it clears the `running` event to stop the task.
+        It then retrieves the task using the `pop` method and inspects it. If the task is not yet completed, the
+        `wake` event is set so that `run` leaves its loop on its own, and the task is only cancelled if it is still
+        running one clock tick later, e.g. because it is blocked in a step.
+
         Returns:
             asyncio.Task:
-                 The task associated with this instance after attempting to cancel it if necessary.
+                 The task associated with this instance, which finishes once it has stopped.
 
         """
         if self.running.is_set():
             self.running.clear()
         task = self.pop(self)
         if not task.done():
-            task.cancel()
-        return typing.cast(asyncio.Task, task)
+            self.wake.set()
+            # cancelling a task that already finished is a no-op
+            self.loop.call_later(self.clock.multiplier, task.cancel)
+        return task
 
     model: T = None
@@ -21,11 +21,21 @@ Architecture Summary:
 This module includes a collection of coroutine functions designed to asynchronously execute the different components of a state machine. It uses `asyncio` to manage asynchronous tasks and employs the `gather` function to handle concurrency. The interpreters maintain the current state of the machine and execute all states and transitions based on the events received. Error handling is implemented to ensure proper management of invalid transitions and other exceptions.
 """
 import asyncio
+import logging
 from stateforward import core, model
-from stateforward.protocols.interpreter import InterpreterStep
+from stateforward.protocols.interpreter import (
+    COMPLETE,
+    INCOMPLETE,
+    DEFERRED,
+)
 from stateforward.state_machine.interpreters.asynchronous.async_behavior_interpreter import (
     AsyncBehaviorInterpreter,
 )
+from stateforward.state_machine.interpreters.asynchronous.async_interpreter import (
+    gather,
+    qualified_name_of,
+    NULL,
+)
 import typing
 
 T = typing.TypeVar("T", bound=core.StateMachine)
@@ -43,6 +53,27 @@ class AsyncStateMachineInterpreter(AsyncBehaviorInterpreter[T]):
              Logger for debug messages.
         stack (dict):
              A tracking structure for the active states and ongoing tasks in the state machine.
+        transition_table (dict[tuple[core.Vertex, type[core.Event]], tuple[core.Transition, ...]]):
+             A cache of the outgoing transitions of a vertex that can be triggered by a given event type,
+            filled the first time the vertex processes an event of that type.
+        descendant_states (dict[core.State, tuple[core.State, ...]]):
+             A cache of the states nested in a state, filled the first time a completion event of the state is awaited.
+        transition_exits (dict[core.Transition, tuple[model.Element, ...]]):
+             A cache of the elements a transition pushes onto the stack, filled the first time the transition is exited.
+        transition_paths (dict[core.Transition, tuple[tuple[core.Vertex, ...], tuple[core.Vertex, ...], core.Vertex]]):
+             A cache of the vertices a transition leaves, the vertices it enters explicitly and its target vertex,
+            filled the first time the transition is executed.
+        active_vertices (dict[core.Region, core.Vertex]):
+             The vertex currently active in each region, kept up to date as vertices are entered and exited.
+        event_entries (dict[type[core.Event], typing.Optional[typing.Callable[[core.Event], asyncio.Future]]]):
+             A cache of the entry method for each event type, or None for event types without one,
+            filled the first time an event of the type is entered.
+        time_events (dict[core.TimeEvent, asyncio.TimerHandle]):
+             The timers of the time events that have been entered and not fired yet, cancelled when their
+            transition is exited.
+        event_tasks (dict[core.Event, asyncio.Task]):
+             The tasks waiting for change and completion events, kept until they finish so they are not
+            garbage collected once the stack no longer refers to them, and cancelled when their transition is exited.
 
     Methods:
         exec_event_processing:
@@ -81,10 +112,48 @@ class AsyncStateMachineInterpreter(AsyncBehaviorInterpreter[T]):
 
     """
 
+    transition_table: dict[
+        tuple[core.Vertex, type[core.Event]], tuple[core.Transition, ...]
+    ] = None
+    descendant_states: dict[core.State, tuple[core.State, ...]] = None
+    transition_exits: dict[core.Transition, tuple[model.Element, ...]] = None
+    transition_paths: dict[
+        core.Transition,
+        tuple[tuple[core.Vertex, ...], tuple[core.Vertex, ...], core.Vertex],
+    ] = None
+    active_vertices: dict[core.Region, core.Vertex] = None
+    event_entries: dict[
+        type[core.Event],
+        typing.Optional[typing.Callable[[core.Event], asyncio.Future]],
+    ] = None
+    time_events: dict[core.TimeEvent, asyncio.TimerHandle] = None
+    event_tasks: dict[core.Event, asyncio.Task] = None
+
+    def __init__(self, *args, **kwargs):
+        """
+        Initializes the interpreter and its empty transition table.
+
+        Args:
+            *args:
+                 Positional arguments forwarded to `AsyncBehaviorInterpreter`.
+            **kwargs:
+                 Keyword arguments forwarded to `AsyncBehaviorInterpreter`.
+
+        """
+        super().__init__(*args, **kwargs)
+        self.transition_table = {}
+        self.descendant_states = {}
+        self.transition_exits = {}
+        self.transition_paths = {}
+        self.active_vertices = {}
+        self.event_entries = {}
+        self.time_events = {}
+        self.event_tasks = {}
+
     async def exec_event_processing(self, event: core.elements.Event):
         """
         Asynchronously processes an event across all regions within a model.
-        This method takes a single event and concurrently processes it through all regions defined in the model. It uses asyncio.gather to asynchronously execute region processing for each region. After all regions have processed the event, the method determines the overall processing result based on the outcomes of the regional processing. The method returns an instance of InterpreterStep to indicate whether event processing is complete, deferred, or incomplete.
+        This method takes a single event and concurrently processes it through all regions defined in the model. It uses the `gather` helper to asynchronously execute region processing for each region, which awaits the region directly when the model has only one. After all regions have processed the event, the method determines the overall processing result based on the outcomes of the regional processing. The method returns an instance of InterpreterStep to indicate whether event processing is complete, deferred, or incomplete.
 
         Args:
             event (core.elements.Event):
@@ -95,18 +164,18 @@ class AsyncStateMachineInterpreter(AsyncBehaviorInterpreter[T]):
                  An enum value indicating the completion state of the event processing. It can either be InterpreterStep.complete if the processing is finished across all regions, InterpreterStep.deferred if at least one region deferred the event, or InterpreterStep.incomplete if all regions are incomplete in processing the event.
 
         """
-        results = await asyncio.gather(
-            *(
+        results = await gather(
+            *[
                 self.exec_region_processing(region, event)
                 for region in self.model.regions
-            )
+            ]
         )
-        if InterpreterStep.complete in results:
-            return InterpreterStep.complete
+        if COMPLETE in results:
+            return COMPLETE
         return (
-            InterpreterStep.deferred
-            if InterpreterStep.deferred in results
-            else InterpreterStep.incomplete
+            DEFERRED
+            if DEFERRED in results
+            else INCOMPLETE
         )
 
     async def exec_region_processing(
@@ -114,8 +183,9 @@ class AsyncStateMachineInterpreter(AsyncBehaviorInterpreter[T]):
     ):
         """
         Performs the execution processing of a given region within a state machine, handling an incoming event.
-        This asynchronous method checks if the region is currently active and proceeds to process the
-        specified event by executing its corresponding active state. It is part of the state machine's
+        This asynchronous method looks up the active state of the region in `active_vertices` and proceeds to process the
+        specified event by executing it. A region without an active state is not active, since its vertex is exited
+        before the region itself is left, so no separate check of the region is needed. It is part of the state machine's
         execution logic which would typically be involved in the workflow of state transitions and event handling.
 
         Args:
@@ -135,13 +205,9 @@ class AsyncStateMachineInterpreter(AsyncBehaviorInterpreter[T]):
                  If the region or event parameters are not instances of their respective expected types.
 
         """
-        if not self.is_active(region):
-            return InterpreterStep.incomplete
-        active_state = next(
-            (state for state in region.subvertex if self.is_active(state)), None
-        )
+        active_state = self.active_vertices.get(region)
         if active_state is None:
-            return InterpreterStep.incomplete
+            return INCOMPLETE
         return await self.exec_state_processing(active_state, event)
 
     async def exec_state_processing(
@@ -149,7 +215,7 @@ class AsyncStateMachineInterpreter(AsyncBehaviorInterpreter[T]):
     ):
         """
         Performs processing on a state within the state machine given an event.
-        This function executes the processing logic associated with a given state. If the state is not active, it immediately returns an incomplete step indicator. Otherwise, it proceeds to check if the state has regions and processes them asynchronously, waiting for all to complete before continuing.
+        This function executes the processing logic associated with a given state. The state is known to be active, since it is only called with the active state of a region. It proceeds to check if the state has regions and processes them asynchronously, waiting for all to complete before continuing.
         If all regions return an incomplete processing result, or there are no regions, it attempts to process the state itself as a vertex. Finally, it returns the result of the processing, whether that be the processing of the regions or the state as a vertex.
 
         Args:
@@ -163,34 +229,33 @@ class AsyncStateMachineInterpreter(AsyncBehaviorInterpreter[T]):
                  The result of the state processing, which can indicate whether the processing is complete, incomplete, or has resulted in a transition.
 
         """
-        if not self.is_active(state):
-            return InterpreterStep.incomplete
-        elif state.regions is not None:
+        regions = state.regions
+        if regions is not None and regions.length:
             result = next(
                 (
                     result
                     for result in (
-                        await asyncio.gather(
-                            *(
+                        await gather(
+                            *[
                                 self.exec_region_processing(region, event)
-                                for region in state.regions
-                            )
+                                for region in regions
+                            ]
                         )
                     )
-                    if result is not InterpreterStep.incomplete
+                    if result is not INCOMPLETE
                 ),
-                InterpreterStep.incomplete,
+                INCOMPLETE,
             )
         else:
-            result = InterpreterStep.incomplete
-        if result is InterpreterStep.incomplete:
+            result = INCOMPLETE
+        if result is INCOMPLETE:
             result = await self.exec_vertex_processing(state, event)
         return result
 
     async def exec_vertex_processing(self, vertex: core.Vertex, event: core.Event):
         """
         Asynchronously processes a given vertex in the state machine with respect to an incoming event.
-        This method iteratively examines all outgoing transitions from the provided vertex. It attempts to process each transition with the given event by invoking the exec_transition_processing method. The processing of transitions continues until either the processing of a transition results in a 'complete' state or all transitions have been processed without reaching a 'complete' state.
+        This method iteratively examines the outgoing transitions from the provided vertex that can be triggered by the type of the event, which are looked up in the transition table. It attempts to process each transition with the given event by invoking the exec_transition_processing method. The processing of transitions continues until either the processing of a transition results in a 'complete' state or all transitions have been processed without reaching a 'complete' state.
 
         Args:
             vertex (core.Vertex):
@@ -203,20 +268,33 @@ class AsyncStateMachineInterpreter(AsyncBehaviorInterpreter[T]):
                  An enum value indicating whether the processing of the vertex resulted in a 'complete' or 'incomplete' state. 'complete' is returned if any of the transitions reached completion, otherwise 'incomplete' is returned if all transitions were processed and none was completed.
 
         """
-        for transition in vertex.outgoing:
+        key = (vertex, type(event))
+        transitions = self.transition_table.get(key)
+        if transitions is None:
+            # the model is static so the transitions an event type can trigger never change
+            transitions = self.transition_table[key] = tuple(
+                transition
+                for transition in vertex.outgoing
+                if any(
+                    isinstance(_event, (key[1], core.AnyEvent))
+                    for _event in transition.events
+                )
+            )
+        for transition in transitions:
             if (
                 await self.exec_transition_processing(transition, event)
-                == InterpreterStep.complete
+                is COMPLETE
             ):
-                return InterpreterStep.complete
-        return InterpreterStep.incomplete
+                return COMPLETE
+        return INCOMPLETE
 
     async def exec_transition_processing(
         self, transition: core.Transition, event: core.Event
     ):
         """
         Performs the processing of a given state transition based on an event.
-        This asynchronous method checks if the specified event matches one of the expected events for the transition, and whether the transition's guard condition (if any) is satisfied. If the conditions are met, the method executes the transition and indicates that the process is complete. If the conditions are not met, the processing is incomplete.
+        This asynchronous method checks whether the transition's guard condition (if any) is satisfied. If it is, the method executes the transition and indicates that the process is complete, otherwise the processing is incomplete.
+        The transition must be triggered by the event, which `exec_vertex_processing` guarantees by only processing the transitions it found in the transition table for the type of the event.
 
         Args:
             transition (core.Transition):
@@ -229,26 +307,63 @@ class AsyncStateMachineInterpreter(AsyncBehaviorInterpreter[T]):
                  An enum indicating whether the transition processing is 'complete' or 'incomplete'.
 
         """
-        if any(
-            isinstance(_event, (type(event), core.AnyEvent))
-            for _event in transition.events
-        ) and (
-            transition.guard is None
-            or await self.exec_constraint_evaluate(transition.guard, event)
-        ):
-            await self.exec_transition(transition, event)
-            return InterpreterStep.complete
-        return InterpreterStep.incomplete
+        guard = transition.guard
+        if guard is not None:
+            # synchronous conditions are evaluated without creating a coroutine
+            result = self._evaluate_guard(guard, event)
+            if asyncio.iscoroutine(result):
+                result = await result
+            if not result:
+                return INCOMPLETE
+        await self.exec_transition(transition, event)
+        return COMPLETE
 
         # could possibly improve this with using state in reverse
 
+    def _evaluate_guard(
+        self, constraint: core.Constraint, event: core.Event
+    ) -> typing.Union[bool, typing.Coroutine[typing.Any, typing.Any, bool]]:
+        """
+        Evaluates a guard constraint without entering a coroutine when its condition is synchronous.
+        Used on the hot path by `exec_transition_processing` and choice pseudostates. Conditions usually return a
+        plain value, which is returned directly; a bool is recognised by its class alone. If the condition returns
+        a Future or a coroutine, a coroutine that awaits it is returned instead, which the caller must await.
+
+        Args:
+            constraint (core.Constraint):
+                 The constraint whose condition must be evaluated.
+            event (core.Event):
+                 The event which is passed to the constraint's condition for evaluation.
+
+        Returns:
+            (Union[bool, Coroutine[Any, Any, bool]]):
+                 The result of the constraint's condition evaluation, or a coroutine resolving to it
+                if the condition is asynchronous.
+
+        """
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(
+                f"evaluating constraint {qualified_name_of(constraint)} for event {qualified_name_of(event)}"
+            )
+        result = constraint.condition(event)
+        # most guards return a bool, which skips both awaitable checks
+        if result.__class__ is not bool and (
+            asyncio.isfuture(result) or asyncio.iscoroutine(result)
+        ):
+            return self.exec_constraint_wait(constraint, result)
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(
+                f"done evaluating constraint {qualified_name_of(constraint)} results are {result}"
+            )
+        return result
+
     async def exec_constraint_evaluate_condition(
         self, constraint: core.Constraint, event: core.Event
     ) -> bool:
         """
         Async method to evaluate a condition of a given constraint in the context of an event.
         This function takes a constraint object and an event object. It executes the condition
-        associated with the constraint by passing the event to it. If the condition function
+        associated with the constraint by passing the event to it through `_evaluate_guard`. If the condition
         returns a Future or is a coroutine, the function awaits the result. Logging is performed
         after the evaluation to indicate that the evaluation is completed, including the result of the evaluation.
 
@@ -263,12 +378,33 @@ class AsyncStateMachineInterpreter(AsyncBehaviorInterpreter[T]):
                  The result of the constraint's condition evaluation.
 
         """
-        result = constraint.condition(event)
-        if asyncio.isfuture(result) or asyncio.iscoroutine(result):
+        result = self._evaluate_guard(constraint, event)
+        if asyncio.iscoroutine(result):
             result = await result
-        self.log.debug(
-            f"done evaluating constraint {model.qualified_name_of(constraint)} results are {result}"
-        )
+        return result
+
+    async def exec_constraint_wait(
+        self, constraint: core.Constraint, result: typing.Awaitable[bool]
+    ) -> bool:
+        """
+        Awaits the result of an asynchronous constraint condition.
+
+        Args:
+            constraint (core.Constraint):
+                 The constraint whose condition was evaluated.
+            result (Awaitable[bool]):
+                 The future or coroutine returned by the constraint's condition.
+
+        Returns:
+            (bool):
+                 The result of the constraint's condition evaluation.
+
+        """
+        result = await result
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(
+                f"done evaluating constraint {qualified_name_of(constraint)} results are {result}"
+            )
         return result
 
     async def exec_constraint_evaluate(
@@ -289,9 +425,6 @@ class AsyncStateMachineInterpreter(AsyncBehaviorInterpreter[T]):
                  A boolean value indicating the result of the constraint evaluation.
 
         """
-        self.log.debug(
-            f"evaluating constraint {model.qualified_name_of(constraint)} for event {model.qualified_name_of(event)}"
-        )
         return await self.exec_constraint_evaluate_condition(constraint, event)
 
     async def exec_transition(
@@ -308,24 +441,32 @@ class AsyncStateMachineInterpreter(AsyncBehaviorInterpreter[T]):
                  The event that may have triggered the transition. Defaults to None.
 
         """
-        self.log.debug(f"executing transition {model.qualified_name_of(transition)}")
-        for vertex in transition.path.leave:
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(f"executing transition {qualified_name_of(transition)}")
+        path = self.transition_paths.get(transition)
+        if path is None:
+            enter = tuple(transition.path.enter)
+            # every vertex on the path is entered explicitly except the target
+            path = self.transition_paths[transition] = (
+                tuple(transition.path.leave),
+                enter[:-1],
+                enter[-1] if enter else None,
+            )
+        leave, enter, target = path
+        for vertex in leave:
             await self.exec_vertex_exit(vertex, event)
         if transition.effect is not None:
             await self.exec_behavior(transition.effect, event)
-        for index, vertex in enumerate(transition.path.enter):
-            await self.exec_vertex_entry(
-                vertex,
-                event,
-                core.EntryKind.default
-                if index == transition.path.enter.length - 1
-                else core.EntryKind.explicit,
-            )
+        if target is not None:
+            explicit = core.EntryKind.explicit
+            for vertex in enter:
+                await self.exec_vertex_entry(vertex, event, explicit)
+            await self.exec_vertex_entry(target, event, core.EntryKind.default)
 
     async def exec_vertex_exit(self, vertex: core.Vertex, event: core.Event):
         """
         Asynchronously executes the exit behavior for a given vertex in a state machine.
-        This coroutine checks if the provided vertex is an instance of `core.State` or any other type. If the vertex is a `core.State`, it performs two main tasks, executed concurrently for efficiency: it calls `exec_transition_exit` for all outgoing transitions, followed by `exec_state_exit` for the state itself. For other types of vertices, identified here as `core.Pseudostate`, it calls `exec_pseudostate_exit`. After executing the appropriate exit behavior, it then removes the vertex from consideration within the current flow by calling the `pop` method.
+        This coroutine checks if the provided vertex is an instance of `core.State` or any other type. If the vertex is a `core.State`, it performs two main tasks: it calls `exec_transition_exit` for all outgoing transitions, followed by `exec_state_exit` for the state itself. For other types of vertices, identified here as `core.Pseudostate`, it calls `exec_pseudostate_exit`. After executing the appropriate exit behavior, it then removes the vertex from consideration within the current flow by calling the `pop` method.
 
         Args:
             vertex (core.Vertex):
@@ -335,23 +476,21 @@ class AsyncStateMachineInterpreter(AsyncBehaviorInterpreter[T]):
 
         """
         if isinstance(vertex, core.State):
-            await asyncio.gather(
-                *(
-                    self.exec_transition_exit(transition)
-                    for transition in vertex.outgoing
-                )
-            )
+            for transition in vertex.outgoing:
+                self.exec_transition_exit(transition)
             await self.exec_state_exit(vertex, event)
         else:
             await self.exec_pseudostate_exit(
                 typing.cast(core.Pseudostate, vertex), event
             )
+        if self.active_vertices.get(vertex.container) is vertex:
+            del self.active_vertices[vertex.container]
         self.pop(vertex)
 
-    async def exec_transition_exit(self, transition: core.Transition):
+    def exec_transition_exit(self, transition: core.Transition):
         """
-        Asynchronously executes the exit logic for a given state machine transition.
-        This method is responsible for handling the exit process when a state machine transition occurs. It iterates over both events associated with the transition and the transition itself, and for each element, it checks whether the element exists in the state machine's stack. If any element is found within the stack, the method will asynchronously pop the element from the stack.
+        Executes the exit logic for a given state machine transition.
+        This method is responsible for handling the exit process when a state machine transition occurs. It iterates over both events associated with the transition and the transition itself, which are cached per transition in `transition_exits`, and pops each of them from the stack. Popping an element that is not in the stack does nothing. The timers of time events of the transition that have not fired yet and the tasks waiting for its change and completion events are cancelled. Nothing here is awaited, so the method is synchronous and is called directly by `exec_vertex_exit`.
 
         Args:
             transition (core.Transition):
@@ -361,9 +500,26 @@ class AsyncStateMachineInterpreter(AsyncBehaviorInterpreter[T]):
             Any exceptions that could occur while popping elements from the stack are implicitly raised and not caught within this function.
 
         """
-        for element in (*transition.events, transition.events, transition):
-            if element in self.stack:
-                self.pop(element)
+        elements = self.transition_exits.get(transition)
+        if elements is None:
+            elements = self.transition_exits[transition] = (
+                *transition.events,
+                transition.events,
+                transition,
+            )
+        pop = self.pop
+        for element in elements:
+            pop(element)
+        time_events, event_tasks = self.time_events, self.event_tasks
+        if time_events or event_tasks:
+            # the transition's source is left, so its pending time, change and completion events must not fire
+            for event in transition.events:
+                handle = time_events.pop(event, None)
+                if handle is not None:
+                    handle.cancel()
+                task = event_tasks.pop(event, None)
+                if task is not None:
+                    task.cancel()
 
     async def exec_vertex_entry(
         self, vertex: core.Vertex, event: core.Event, kind: core.EntryKind
@@ -381,8 +537,8 @@ class AsyncStateMachineInterpreter(AsyncBehaviorInterpreter[T]):
                  The kind of entry action to be performed. This helps determine how deep the entry logic should go; for instance, it could specify entering only the top state or recursive entry to all substates.
 
         Returns:
-            (List[object]):
-                 A list of results from execution of entry logic and transitions originating from the vertex. The content of this list can vary depending on the type of vertex and number of transitions.
+            (typing.Any):
+                 The result of the final state or pseudostate entry logic, or None when a state is entered.
 
         Raises:
             TypeError:
@@ -390,15 +546,12 @@ class AsyncStateMachineInterpreter(AsyncBehaviorInterpreter[T]):
 
         """
         self.push(vertex)
+        self.active_vertices[vertex.container] = vertex
         if isinstance(vertex, core.State):
             await self.exec_state_entry(vertex, event, kind)
-            results = await asyncio.gather(
-                *(
-                    self.exec_transition_entry(transition)
-                    for transition in vertex.outgoing
-                )
-            )
-
+            for transition in vertex.outgoing:
+                self.exec_transition_entry(transition)
+            results = None
         elif isinstance(vertex, core.FinalState):
             results = await self.exec_final_state_entry(vertex, event)
         else:
@@ -451,7 +604,7 @@ class AsyncStateMachineInterpreter(AsyncBehaviorInterpreter[T]):
     async def exec_change_event_wait(self, event: core.ChangeEvent):
         """
         Performs an asynchronous wait for a change event to meet a certain condition before sending the event class associated with the event.
-        This function enters an infinite loop that continuously checks if the condition specified by the `expr` attribute of the `event` argument is met. If the condition evaluates to `True`, the function sends an instance of the event's class using the `send` coroutine and then breaks out of the loop. Otherwise, it awaits asynchronously for a very brief time (`0` seconds) before checking the condition again, allowing other asynchronous operations to proceed in the meantime.
+        This function checks if the condition specified by the `expr` attribute of the `event` argument is met. If the condition evaluates to `True`, the function sends an instance of the event's class using the `send` coroutine. Otherwise, it sleeps for one tick of the interpreter's clock (`clock.multiplier` seconds) before checking the condition again, so a pending change event does not keep the event loop busy.
 
         Args:
             event (core.ChangeEvent):
@@ -465,11 +618,11 @@ class AsyncStateMachineInterpreter(AsyncBehaviorInterpreter[T]):
                  This function does not return a value.
 
         """
-        while True:
-            if event.expr(event):
-                await self.send(event.__class__())
-                break
-            await asyncio.sleep(0)
+        # expr may read any state so it is polled once per clock tick rather than on every loop iteration
+        clock = self.clock
+        while not event.expr(event):
+            await asyncio.sleep(clock.multiplier)
+        await self.send(event.__class__())
 
     def exec_change_event_entry(self, event: core.ChangeEvent) -> asyncio.Task:
         """
@@ -485,51 +638,60 @@ class AsyncStateMachineInterpreter(AsyncBehaviorInterpreter[T]):
                  The asyncio Task object created for the change event.
 
         """
-        return asyncio.create_task(
-            self.exec_change_event_wait(event), name=model.qualified_name_of(event)
-        )
+        return self.exec_event_task(self.exec_change_event_wait(event), event)
 
-    async def exec_time_event_wait(self, event: core.TimeEvent) -> None:
+    def exec_time_event_fire(self, event: core.TimeEvent, future: asyncio.Future):
         """
-        Async function to wait for a specific time event and then send the event.
-        This asynchronous method takes a time event object and performs a sleep operation for the duration specified by the `when` attribute of the time event. After the wait period is over, it sends the event.
+        Queues a time event once its delay has elapsed.
+        This method is scheduled on the event loop by `exec_time_event_entry`. It pushes a new instance of the time event's class and puts it on the queue like `send`, but without a waiter since nothing awaits it from a loop callback. An interpreter that is no longer running does not get the event. The handle is dropped from `time_events` and the future returned by `exec_time_event_entry` is resolved in any case, so the future resolves once the event is queued rather than once it has been processed.
 
         Args:
             event (core.TimeEvent):
-                 The time event object containing the `when` attribute, which specifies the duration to wait before sending the event.
+                 The time event whose delay has elapsed.
+            future (asyncio.Future):
+                 The future returned by `exec_time_event_entry` for the time event.
 
         Returns:
             None
 
         """
-        await asyncio.sleep(event.when.total_seconds())
-        await self.send(event.__class__())
-
-    def exec_time_event_entry(self, event: core.TimeEvent):
+        try:
+            self.time_events.pop(event, None)
+            # a terminated interpreter never processes the event, so it is not queued
+            if self.is_active(self):
+                instance = event.__class__()
+                self.push(instance, self.loop.create_future())
+                self.enqueue(instance)
+        finally:
+            if not future.done():
+                future.set_result(None)
+
+    def exec_time_event_entry(self, event: core.TimeEvent) -> asyncio.Future:
         """
         Schedules the execution of a time-based event.
-        This function initiates an asynchronous task to handle a time-event in the context of the current model's state machine.
-        It uses the asyncio library to create a new task which will await the execution of the 'exec_time_event_wait' coroutine.
-        The task is assigned a name that corresponds to the fully qualified name of the event, which is retrieved using the 'model.qualified_name_of' method.
+        This function schedules 'exec_time_event_fire' on the interpreter's event loop to run once the duration specified by the `when` attribute of the time event has elapsed. The loop keeps all its timers in a single heap, so a pending time event costs a timer handle instead of a task and a suspended coroutine. The handle is kept in `time_events` so `exec_transition_exit` can cancel it when the transition's source is left first.
 
         Args:
             event (core.TimeEvent):
                  An instance of a time-based event that is to be handled by the state machine.
 
         Returns:
-            (asyncio.Task):
-                 The newly created asyncio task object that is responsible for executing the time-event.
+            (asyncio.Future):
+                 A future that is resolved once the time event has been queued, not once it has been processed.
 
         """
-        return asyncio.create_task(
-            self.exec_time_event_wait(event), name=model.qualified_name_of(event)
+        loop = self.loop
+        future = loop.create_future()
+        self.time_events[event] = loop.call_later(
+            event.when.total_seconds(), self.exec_time_event_fire, event, future
         )
+        return future
 
     async def exec_completion_event_wait(self, event: core.CompletionEvent):
         """
         Awaits the completion of an event within a state machine, gathering futures related to activities in descendant states.
         This asynchronous method is designed to handle the completion of a given event within the context of a state machine.
-        It first retrieves the state that owns the provided event and then awaits the future associated with the activity of that state. Once the awaited future completes, its value is stored within the event's value attribute. Subsequently, the method identifies all activities associated with descendant states of the source state and collects their associated futures. It awaits the completion of all these futures concurrently using `asyncio.gather`. Finally, the event is pushed to an internal stack for further processing.
+        It first retrieves the state that owns the provided event and then awaits the future associated with the activity of that state. Once the awaited future completes, its value is stored within the event's value attribute. Subsequently, the method looks up the active states nested in the source state, using the states cached in `descendant_states`, and collects the futures of their activities. It awaits the completion of all these futures concurrently. Finally, the event is pushed to an internal stack for further processing.
 
         Args:
             event (core.CompletionEvent):
@@ -539,13 +701,19 @@ class AsyncStateMachineInterpreter(AsyncBehaviorInterpreter[T]):
         source: core.State = model.owner_of(event)
         future = self.stack.get(source.activity)
         event.value = await future
+        descendants = self.descendant_states.get(source)
+        if descendants is None:
+            # the model is static so the states nested in a state never change
+            descendants = self.descendant_states[source] = tuple(
+                element
+                for element in model.element.descendants_of(source)
+                if model.element.is_subtype(element, core.State)
+            )
+        stack = self.stack
         activities = tuple(
-            self.stack.get(typing.cast(core.State, state).activity)
-            for state in self.stack
-            if model.element.is_subtype(state, core.State)
-            and model.element.is_descendant_of(source, state)
+            stack.get(state.activity) for state in descendants if state in stack
         )
-        await asyncio.gather(*activities)
+        await gather(*activities)
         self.push(event)
 
     def exec_completion_event_entry(self, event: core.CompletionEvent) -> asyncio.Task:
@@ -563,18 +731,49 @@ class AsyncStateMachineInterpreter(AsyncBehaviorInterpreter[T]):
                  The asyncio task created to wait for the event to complete.
 
         """
-        qualified_name = model.qualified_name_of(event)
-        self.log.debug(f"entering completion event {qualified_name}")
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(f"entering completion event {qualified_name_of(event)}")
         event.value = None
-        task = asyncio.create_task(
-            self.exec_completion_event_wait(event), name=qualified_name
+        return self.exec_event_task(self.exec_completion_event_wait(event), event)
+
+    def exec_event_task(
+        self, coroutine: typing.Coroutine, event: core.Event
+    ) -> asyncio.Task:
+        """
+        Creates a task waiting for an event and keeps a reference to it until it is done.
+        The event loop only keeps weak references to tasks, so the task is kept in `event_tasks` under its event and
+        removed again by a done callback once it finishes. `exec_transition_exit` cancels it if the transition's
+        source is left before the event occurs.
+
+        Args:
+            coroutine (typing.Coroutine):
+                 The coroutine waiting for the event.
+            event (core.Event):
+                 The event being waited for, used to name and look up the task.
+
+        Returns:
+            (asyncio.Task):
+                 The task running the coroutine.
+
+        """
+        event_tasks = self.event_tasks
+        task = event_tasks[event] = self.create_task(
+            coroutine, name=qualified_name_of(event)
         )
+
+        def discard(task: asyncio.Task) -> None:
+            # a cancelled task finishes later, by then the event may have been entered again
+            if event_tasks.get(event) is task:
+                del event_tasks[event]
+
+        task.add_done_callback(discard)
         return task
 
     def exec_event_entry(self, event: core.Event) -> typing.Optional[asyncio.Task]:
         """
         Executes the entry logic for a given event in the state machine.
-        This method dispatches the execution based on the type of event received. Depending on the type of the event,
+        This method dispatches the execution based on the type of event received, using the entry method cached in
+        `event_entries` for the type and resolving it with `exec_event_entry_of` on a miss. Depending on the type of the event,
         different execution paths are taken:
         - `core.TimeEvent`: Executes the logic specific for time-triggered events.
         - `core.CompletionEvent`: Executes the logic specific for completion-triggered events.
@@ -591,23 +790,44 @@ class AsyncStateMachineInterpreter(AsyncBehaviorInterpreter[T]):
                 of the event doesn't create an asynchronous task.
 
         """
-        qualified_name = model.qualified_name_of(event)
-        self.log.debug(f"entering event {qualified_name}")
-        if isinstance(event, core.TimeEvent):
-            return self.exec_time_event_entry(event)
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(f"entering event {qualified_name_of(event)}")
+        entry = self.event_entries.get(event.__class__, NULL)
+        if entry is NULL:
+            entry = self.event_entries[event.__class__] = self.exec_event_entry_of(
+                event.__class__
+            )
+        if entry is not None:
+            return entry(event)
 
-        elif isinstance(event, core.CompletionEvent):
-            return self.exec_completion_event_entry(event)
+    def exec_event_entry_of(
+        self, event_type: type[core.Event]
+    ) -> typing.Optional[typing.Callable[[core.Event], asyncio.Future]]:
+        """
+        Resolves the entry method for a type of event.
 
-        elif isinstance(event, core.ChangeEvent):
-            return self.exec_change_event_entry(event)
+        Args:
+            event_type (type[core.Event]):
+                 The type of event to resolve the entry method for.
 
-    async def exec_transition_entry(self, transition: core.Transition) -> None:
+        Returns:
+            (typing.Optional[typing.Callable[[core.Event], asyncio.Future]]):
+                 The bound entry method for time, completion and change events, or None for other events.
+
+        """
+        if issubclass(event_type, core.TimeEvent):
+            return self.exec_time_event_entry
+        elif issubclass(event_type, core.CompletionEvent):
+            return self.exec_completion_event_entry
+        elif issubclass(event_type, core.ChangeEvent):
+            return self.exec_change_event_entry
+
+    def exec_transition_entry(self, transition: core.Transition) -> None:
         """
         Performs entry operations for a given state transition in an asynchronous state machine.
         This method logs the entering of a transition, then pushes the transition onto the state stack. It
-        proceeds to gather tasks associated with the entry events of the transition, executes them asynchronously,
-        and waits for their completion before advancing.
+        proceeds to start the tasks associated with the entry events of the transition and pushes a future
+        waiting on them for the transition's events. Nothing is awaited, so the method is synchronous.
 
         Args:
             transition (core.Transition):
@@ -623,14 +843,15 @@ class AsyncStateMachineInterpreter(AsyncBehaviorInterpreter[T]):
             the tasks executed during transition entry, which should be handled by the calling context.
 
         """
-        qualified_name = model.qualified_name_of(transition)
-        self.log.debug(f"entering transition {qualified_name}")
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(f"entering transition {qualified_name_of(transition)}")
         self.push(transition)
-        tasks = []
-        for event in transition.events:
-            task = self.exec_event_entry(event)
-            if task is not None:
-                tasks.append(task)
+        exec_event_entry = self.exec_event_entry
+        tasks = [
+            task
+            for task in map(exec_event_entry, transition.events)
+            if task is not None
+        ]
         if tasks:
             self.push(
                 transition.events,
@@ -661,23 +882,22 @@ class AsyncStateMachineInterpreter(AsyncBehaviorInterpreter[T]):
             None
 
         """
-        qualified_name = model.qualified_name_of(state)
-        self.log.debug(f"entering state {qualified_name}")
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(f"entering state {qualified_name_of(state)}")
         if state.entry is not None:
             await self.exec_behavior(state.entry, event)
         if state.activity is not None:
             self.push(
                 state.activity,
-                self.loop.create_task(self.exec_behavior(state.activity, event)),
+                self.create_task(self.exec_behavior(state.activity, event)),
             )
         if state.submachine is not None:
             return
-        await asyncio.gather(
-            *(
-                self.exec_region_entry(region, event, kind)
-                for region in state.regions or []
+        regions = state.regions
+        if regions is not None and regions.length:
+            await gather(
+                *[self.exec_region_entry(region, event, kind) for region in regions]
             )
-        )
 
     async def exec_state_machine_entry(
         self,
@@ -705,14 +925,14 @@ class AsyncStateMachineInterpreter(AsyncBehaviorInterpreter[T]):
             behavior for all regions within the state machine.
 
         """
-        self.log.debug(
-            f'entering state machine "{model.qualified_name_of(state_machine)}" with {state_machine.regions.length} regions'
-        )
-        return await asyncio.gather(
-            *(
-                self.exec_region_entry(region, event, kind)
-                for region in state_machine.regions
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(
+                f'entering state machine "{qualified_name_of(state_machine)}" with {state_machine.regions.length} regions'
             )
+        # the regions are entered as tasks even if there is only one, which lets the completion event
+        # waits started while entering settle before the first step processes their events
+        return await asyncio.gather(
+            *[self.exec_region_entry(region, event, kind) for region in state_machine.regions]
         )
 
     async def exec_region_entry(
@@ -745,10 +965,10 @@ class AsyncStateMachineInterpreter(AsyncBehaviorInterpreter[T]):
             and the region has an initial pseudostate.
 
         """
-        qualified_name = model.qualified_name_of(region)
-        self.log.debug(f"entering region {qualified_name}")
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(f"entering region {qualified_name_of(region)}")
         states = ()
-        if kind == core.EntryKind.default:
+        if kind is core.EntryKind.default:
             if region.initial is None:
                 return states
             self.push(region)
@@ -759,7 +979,7 @@ class AsyncStateMachineInterpreter(AsyncBehaviorInterpreter[T]):
     async def exec_region_exit(self, region: core.Region, event: core.Event):
         """
         Asynchronously exits a region within a state machine.
-        This method handles the process of exiting a region by first determining the region's qualified name and logging the exit action. It then identifies the active vertex (state) of the region currently on the stack, if any. If an active vertex exists, the method ensures its proper exit sequence is executed. Finally, the region is popped from the internal state stack.
+        This method handles the process of exiting a region by first determining the region's qualified name and logging the exit action. It then looks up the active vertex (state) of the region in `active_vertices`, if any. If an active vertex exists, the method ensures its proper exit sequence is executed. Finally, the region is popped from the internal state stack.
         This method is an asynchronous coroutine and should be awaited.
 
         Args:
@@ -769,12 +989,9 @@ class AsyncStateMachineInterpreter(AsyncBehaviorInterpreter[T]):
                  The event instance that triggered the exit.
 
         """
-        qualified_name = model.qualified_name_of(region)
-        self.log.debug(f'leaving region "{qualified_name}"')
-        active_vertex = next(
-            (vertex for vertex in region.subvertex if vertex in self.stack),
-            None,
-        )
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(f'leaving region "{qualified_name_of(region)}"')
+        active_vertex = self.active_vertices.get(region)
         if active_vertex is not None:
             await self.exec_vertex_exit(active_vertex, event)
         self.pop(region)
@@ -812,23 +1029,20 @@ class AsyncStateMachineInterpreter(AsyncBehaviorInterpreter[T]):
                  The event that triggered the state exit, if any.
 
         """
-        qualified_name = model.qualified_name_of(state)
         if state.submachine is not None:
             await self.exec_state_machine_exit(state.submachine, event)
         else:
-            await asyncio.gather(
-                *(
-                    self.exec_region_exit(region, event)
-                    for region in state.regions or []
-                )
-            )
+            regions = state.regions
+            if regions is not None and regions.length:
+                await gather(*[self.exec_region_exit(region, event) for region in regions])
         if state.activity is not None:
             activity = self.pop(state.activity)
             if not activity.done():
                 activity.cancel()
         if state.exit is not None:
             await self.exec_behavior(state.exit, event)
-        self.log.debug(f'leaving state "{qualified_name}"')
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(f'leaving state "{qualified_name_of(state)}"')
 
     async def exec_state_machine_exit(
         self,
@@ -849,11 +1063,12 @@ class AsyncStateMachineInterpreter(AsyncBehaviorInterpreter[T]):
                 This parameter may be None, indicating that no specific event is associated with the exit action.
 
         """
-        self.log.debug(
-            f'leaving state machine "{model.qualified_name_of(state_machine)}"'
-        )
-        await asyncio.gather(
-            *(self.exec_region_exit(region, event) for region in state_machine.regions)
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(
+                f'leaving state machine "{qualified_name_of(state_machine)}"'
+            )
+        await gather(
+            *[self.exec_region_exit(region, event) for region in state_machine.regions]
         )
 
     async def exec_pseudostate_entry(
@@ -885,30 +1100,37 @@ class AsyncStateMachineInterpreter(AsyncBehaviorInterpreter[T]):
             the case of a 'fork' pseudostate).
 
         """
-        self.log.debug(
-            f"entering {pseudostate.kind.value} psuedostate {model.qualified_name_of(pseudostate)}"
-        )
-        if pseudostate.kind == core.PseudostateKind.initial:
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(
+                f"entering {pseudostate.kind.value} psuedostate {qualified_name_of(pseudostate)}"
+            )
+        # enum members are singletons so the kind is compared by identity
+        kind = pseudostate.kind
+        if kind is core.PseudostateKind.initial:
             return await self.exec_transition(pseudostate.outgoing[0], event)
-        elif pseudostate.kind == core.PseudostateKind.choice:
+        elif kind is core.PseudostateKind.choice:
             for transition in pseudostate.outgoing:
-                if transition.guard is None or await self.exec_constraint_evaluate(
-                    transition.guard, event
-                ):
-                    return await self.exec_transition(transition, event)
+                guard = transition.guard
+                if guard is not None:
+                    result = self._evaluate_guard(guard, event)
+                    if asyncio.iscoroutine(result):
+                        result = await result
+                    if not result:
+                        continue
+                return await self.exec_transition(transition, event)
             raise Exception("no valid transition this should never throw")
-        elif pseudostate.kind == core.PseudostateKind.join:
-            if all(
-                transition.source not in self.stack
-                for transition in pseudostate.incoming
+        elif kind is core.PseudostateKind.join:
+            # the join fires once none of its incoming sources is active any more
+            if self.stack.keys().isdisjoint(
+                transition.source for transition in pseudostate.incoming
             ):
                 return await self.exec_transition(pseudostate.outgoing[0], event)
-        elif pseudostate.kind == core.PseudostateKind.fork:
-            return await asyncio.gather(
-                *(
+        elif kind is core.PseudostateKind.fork:
+            return await gather(
+                *[
                     self.exec_transition(transition, event)
                     for transition in pseudostate.outgoing
-                )
+                ]
             )
 
     async def run(self):
@@ -925,14 +1147,16 @@ class AsyncStateMachineInterpreter(AsyncBehaviorInterpreter[T]):
                  If the asynchronous task that called `run` is cancelled.
 
         """
-        self.log.debug(f'running state machine "{model.qualified_name_of(self.model)}"')
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(f'running state machine "{qualified_name_of(self.model)}"')
         await self.exec_state_machine_entry(self.model, None, core.EntryKind.default)
         try:
             await self.step()
         except asyncio.CancelledError:
-            self.log.debug(
-                f'stopping state machine "{model.qualified_name_of(self.model)}"'
-            )
+            if self.log.isEnabledFor(logging.DEBUG):
+                self.log.debug(
+                    f'stopping state machine "{qualified_name_of(self.model)}"'
+                )
             return
         return await super().run()
 
@@ -0,0 +1,134 @@
+import asyncio
+import pytest
+import stateforward as sf
+from stateforward.state_machine.interpreters.asynchronous.async_interpreter import (
+    AsyncInterpreter,
+    NULL,
+)
+
+
+class E(sf.Event):
+    pass
+
+
+class SM(sf.AsyncStateMachine):
+    class s1(sf.State):
+        pass
+
+    initial = sf.initial(s1)
+
+
+def test_null_is_done():
+    assert NULL.done() and not NULL.cancelled()
+    assert NULL.result() is None and NULL.exception() is None
+    called = []
+    NULL.add_done_callback(called.append)
+    assert called == [NULL]
+
+
+@pytest.mark.asyncio
+async def test_null_is_awaitable():
+    assert await NULL is None
+
+
+@pytest.mark.asyncio
+async def test_push_without_future():
+    sm = SM()
+    await sm.interpreter.start()
+    element = sm.s1.__class__
+    assert sm.interpreter.push(element) is NULL
+    with pytest.raises(ValueError):
+        sm.interpreter.push(element)
+    assert sm.interpreter.pop(element) is NULL
+    await sm.interpreter.terminate()
+
+
+@pytest.mark.asyncio
+async def test_failed_activity_raises_on_exit():
+    class FailingSM(sf.AsyncStateMachine):
+        class s1(sf.State):
+            @sf.decorators.behavior
+            async def activity(self, event=None):
+                await asyncio.sleep(0.01)
+                raise ValueError()
+
+        initial = sf.initial(s1)
+
+    sm = FailingSM()
+    await sm.interpreter.start()
+    activity = sm.interpreter.stack[sm.s1.activity]
+    await asyncio.sleep(0.02)
+    assert isinstance(activity.exception(), ValueError)
+    # the failure does not stop the interpreter, events are still processed
+    await sm.interpreter.send(E())
+    assert sm.interpreter.running.is_set()
+    # it is raised once the state is exited
+    with pytest.raises(ValueError):
+        await sm.interpreter.terminate()
+
+
+@pytest.mark.asyncio
+async def test_send_after_terminate():
+    sm = SM()
+    await sm.interpreter.start()
+    await sm.interpreter.terminate()
+    event = E()
+    with pytest.raises(RuntimeError):
+        await sm.interpreter.send(event)
+    assert event not in sm.interpreter.stack
+    assert not sm.interpreter.queue
+
+
+def test_configure_without_uvloop():
+    assert AsyncInterpreter.configure(use_uvloop=False) is False
+
+
+@pytest.mark.asyncio
+async def test_wait_propagates_exception():
+    sm = SM()
+    await sm.interpreter.start()
+    loop = sm.interpreter.loop
+    first, second = loop.create_future(), loop.create_future()
+    waiter = sm.interpreter.wait(first, second)
+    first.set_exception(ValueError())
+    with pytest.raises(ValueError):
+        await waiter
+    first, second = loop.create_future(), loop.create_future()
+    waiter = sm.interpreter.wait(first, second, return_when=asyncio.ALL_COMPLETED)
+    first.set_result(None)
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    second.set_result(None)
+    assert await waiter is None
+    await sm.interpreter.terminate()
+
+
+@pytest.mark.asyncio
+async def test_idle_interpreter_waits_for_wake():
+    sm = SM()
+    await sm.interpreter.start()
+    await asyncio.sleep(0.01)
+    assert not sm.interpreter.wake.is_set()
+    sm.interpreter.push(sm.s1.__class__)
+    assert sm.interpreter.wake.is_set()
+    sm.interpreter.pop(sm.s1.__class__)
+    await sm.interpreter.terminate()
+
+
+@pytest.mark.asyncio
+async def test_queued_events_are_processed_in_one_step():
+    sm = SM()
+    await sm.interpreter.start()
+    batches = []
+    drain = sm.interpreter.drain
+
+    def counting_drain():
+        events = drain()
+        if events:
+            batches.append(len(events))
+        return events
+
+    sm.interpreter.drain = counting_drain
+    await asyncio.gather(*(sm.interpreter.send(E()) for _ in range(3)))
+    assert batches == [3]
+    await sm.interpreter.terminate()
@@ -0,0 +1,75 @@
+import asyncio
+import stateforward as sf
+import pytest
+
+
+class ChangeSM(sf.AsyncStateMachine):
+    flag: bool = False
+
+    class s1(sf.State):
+        pass
+
+    class s2(sf.State):
+        pass
+
+    initial = sf.initial(s1)
+    transition_to_s2 = sf.transition(
+        sf.when(lambda self, event: self.model.flag), source=s1, target=s2
+    )
+
+
+@pytest.mark.asyncio
+async def test_change_event():
+    sm = ChangeSM()
+    await sm.interpreter.start()
+    await asyncio.sleep(0.01)
+    assert sm.interpreter.is_active(sm.s1)
+    sm.flag = True
+    for _ in range(100):
+        if sm.interpreter.is_active(sm.s2):
+            break
+        await asyncio.sleep(0.001)
+    assert sm.interpreter.is_active(sm.s2)
+    await sm.interpreter.terminate()
+
+
+class Leave(sf.Event):
+    pass
+
+
+class LeaveSM(sf.AsyncStateMachine):
+    flag: bool = False
+
+    class s1(sf.State):
+        pass
+
+    class s2(sf.State):
+        pass
+
+    class s3(sf.State):
+        pass
+
+    initial = sf.initial(s1)
+    transitions = sf.collection(
+        sf.transition(
+            sf.when(lambda self, event: self.model.flag), source=s1, target=s2
+        ),
+        sf.transition(Leave, source=s1, target=s3),
+    )
+
+
+@pytest.mark.asyncio
+async def test_change_event_is_cancelled_on_exit():
+    sm = LeaveSM()
+    await sm.interpreter.start()
+    (task,) = sm.interpreter.event_tasks.values()
+    await sm.interpreter.send(Leave())
+    assert sm.interpreter.is_active(sm.s3)
+    assert not sm.interpreter.event_tasks
+    sm.flag = True
+    await asyncio.sleep(0.05)
+    # the poller was cancelled instead of sending the change event once the flag flipped
+    assert task.cancelled()
+    assert sm.interpreter.is_active(sm.s3)
+    assert not sm.interpreter.is_active(sm.s2)
+    await sm.interpreter.terminate()
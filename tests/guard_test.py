@@ -0,0 +1,46 @@
+import stateforward as sf
+import pytest
+
+
+class GuardEvent(sf.Event):
+    pass
+
+
+def is_allowed(self, event: sf.Event) -> bool:
+    return self.model.allowed
+
+
+class GuardSM(sf.AsyncStateMachine):
+    def __init__(self, allowed: bool = True):
+        self.allowed = allowed
+
+    class s1(sf.State):
+        pass
+
+    class s2(sf.State):
+        pass
+
+    initial = sf.initial(s1)
+    transition_to_s2 = sf.transition(GuardEvent, source=s1, target=s2, guard=is_allowed)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("allowed", [True, False])
+async def test_synchronous_guard(allowed: bool):
+    sm = GuardSM(allowed=allowed)
+    await sm.interpreter.start()
+    await sf.send(GuardEvent(), sm)
+    active = sm.s2 if allowed else sm.s1
+    assert sm.interpreter.is_active(active)
+    assert sm.interpreter.active_vertices[active.container] is active
+    await sm.interpreter.terminate()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("allowed", [True, False])
+async def test_constraint_evaluate_is_awaitable(allowed: bool):
+    sm = GuardSM(allowed=allowed)
+    await sm.interpreter.start()
+    guard = sm.transition_to_s2.guard
+    assert await sm.interpreter.exec_constraint_evaluate(guard, GuardEvent()) is allowed
+    await sm.interpreter.terminate()
@@ -0,0 +1,78 @@
+import asyncio
+import stateforward as sf
+import pytest
+
+
+class TimeSM(sf.AsyncStateMachine):
+    class s1(sf.State):
+        pass
+
+    class s2(sf.State):
+        pass
+
+    initial = sf.initial(s1)
+    transition_to_s2 = sf.transition(sf.after(milliseconds=5), source=s1, target=s2)
+
+
+@pytest.mark.asyncio
+async def test_time_event():
+    sm = TimeSM()
+    await sm.interpreter.start()
+    assert sm.interpreter.is_active(sm.s1)
+    for _ in range(100):
+        if sm.interpreter.is_active(sm.s2):
+            break
+        await asyncio.sleep(0.001)
+    assert sm.interpreter.is_active(sm.s2)
+    await sm.interpreter.terminate()
+
+
+class Leave(sf.Event):
+    pass
+
+
+class Return(sf.Event):
+    pass
+
+
+class TimeoutSM(sf.AsyncStateMachine):
+    class s1(sf.State):
+        pass
+
+    class s2(sf.State):
+        pass
+
+    class s3(sf.State):
+        pass
+
+    initial = sf.initial(s1)
+    timeout = sf.transition(sf.after(milliseconds=100), source=s1, target=s2)
+    leave = sf.transition(Leave, source=s1, target=s3)
+    back = sf.transition(Return, source=s3, target=s1)
+
+
+@pytest.mark.asyncio
+async def test_time_event_is_cancelled_on_exit():
+    sm = TimeoutSM()
+    await sm.interpreter.start()
+    await asyncio.sleep(0.06)
+    # leaving s1 cancels its timer, re-entering it starts a new one
+    await sf.send(Leave(), sm)
+    await sf.send(Return(), sm)
+    assert sm.interpreter.is_active(sm.s1)
+    await asyncio.sleep(0.06)
+    assert sm.interpreter.is_active(sm.s1)
+    await sm.interpreter.terminate()
+
+
+@pytest.mark.asyncio
+async def test_time_event_fire_after_terminate():
+    sm = TimeSM()
+    await sm.interpreter.start()
+    await sm.interpreter.terminate()
+    (event,) = sm.transition_to_s2.events
+    future = sm.interpreter.loop.create_future()
+    # a timer firing after the interpreter stopped neither raises nor queues the event
+    sm.interpreter.exec_time_event_fire(event, future)
+    assert future.done()
+    assert not sm.interpreter.queue